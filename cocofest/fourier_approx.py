@@ -1,4 +1,4 @@
-from casadi import cos, sin
+from casadi import DM, cos, dot, sin
 import matplotlib.pyplot as plt
 import numpy as np
 import scipy.integrate as spi
@@ -10,32 +10,26 @@ class FourierSeries:
 
     # function that computes the real fourier couples of coefficients (a0, 0), (a1, b1)...(aN, bN)
     def compute_real_fourier_coeffs(self, x, y, n):
-        result = []
-        for i in range(n + 1):
-            an = (2.0 / self.p) * spi.trapz(y * np.cos(2 * np.pi * i * x / self.p), x)
-            bn = (2.0 / self.p) * spi.trapz(y * np.sin(2 * np.pi * i * x / self.p), x)
-            result.append((an, bn))
-        return np.array(result)
+        x = np.asarray(x)
+        y = np.asarray(y)
+        # (n + 1, len(x)) matrix of the harmonic angles, every coefficient is integrated in a single call
+        angle = 2 * np.pi * np.arange(n + 1)[:, np.newaxis] * x / self.p
+        an = (2.0 / self.p) * spi.trapz(y * np.cos(angle), x, axis=1)
+        bn = (2.0 / self.p) * spi.trapz(y * np.sin(angle), x, axis=1)
+        return np.column_stack((an, bn))
 
     # function that computes the real form Fourier series using an and bn coefficients
     def fit_func_by_fourier_series_with_real_coeffs(self, x, ab, mode="numpy"):
-        result = 0.0
         a = ab[:, 0]
         b = ab[:, 1]
+        harmonics = np.arange(1, len(ab))
         if mode == "numpy":
-            for n in range(0, len(ab)):
-                if n > 0:
-                    result += a[n] * np.cos(2.0 * np.pi * n * x / self.p) + b[n] * np.sin(2.0 * np.pi * n * x / self.p)
-                else:
-                    result += a[0] / 2.0
-            return result
+            angle = 2.0 * np.pi * np.multiply.outer(harmonics, np.asarray(x)) / self.p
+            return a[0] / 2.0 + a[1:] @ np.cos(angle) + b[1:] @ np.sin(angle)
         elif mode == "casadi":
-            for n in range(0, len(ab)):
-                if n > 0:
-                    result += a[n] * cos(2.0 * np.pi * n * x / self.p) + b[n] * sin(2.0 * np.pi * n * x / self.p)
-                else:
-                    result += a[0] / 2.0
-            return result
+            # The harmonics are stacked in a single vector so the series is two dot products instead of a sum of scalars
+            angle = 2.0 * np.pi * DM(harmonics) * x / self.p
+            return a[0] / 2.0 + dot(DM(a[1:]), cos(angle)) + dot(DM(b[1:]), sin(angle))
 
     def fourier_approx(self, x, y, n):
         # AB contains the list of couples of (an, bn) coefficients for n in 1..N interval.
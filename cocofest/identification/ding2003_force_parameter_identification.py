@@ -477,10 +477,14 @@ class DingModelFrequencyForceParameterIdentification:
 
     @staticmethod
     def force_at_node_in_ocp(time, force, n_shooting, final_time_phase, sparse=None):
-        temp_time = []
-        for i in range(len(final_time_phase)):
-            for j in range(n_shooting[i]):
-                temp_time.append(sum(final_time_phase[:i]) + j * final_time_phase[i] / (n_shooting[i]))
+        # The node times of each phase are built at once and the force is interpolated in a single call
+        phase_start_time = np.concatenate(([0], np.cumsum(final_time_phase)[:-1]))
+        temp_time = np.concatenate(
+            [
+                phase_start_time[i] + np.arange(n_shooting[i]) * final_time_phase[i] / n_shooting[i]
+                for i in range(len(final_time_phase))
+            ]
+        )
         force_at_node = np.interp(temp_time, time, force).tolist()
         # if sparse:  # TODO check this part
         #     force_at_node = force_at_node[0:sparse] + force_at_node[:-sparse]
@@ -488,16 +492,14 @@ class DingModelFrequencyForceParameterIdentification:
 
     @staticmethod
     def node_shooting_list_creation(stim, stimulated_n_shooting):
+        stim = np.asarray(stim)
         first_final_time = stim[1] if stim[0] == 0 else stim[0]
-        final_time_phase = (first_final_time,)
-        for i in range(1, len(stim)):
-            final_time_phase = final_time_phase + (stim[i] - stim[i - 1],)
+        final_time_phase = np.concatenate(([first_final_time], np.diff(stim)))
 
         threshold_stimulation_interval = np.mean(final_time_phase)
-        stimulation_interval_average_without_rest_time = np.delete(
-            np.array(final_time_phase),
-            np.where(np.logical_or(final_time_phase > threshold_stimulation_interval, np.array(final_time_phase) == 0)),
-        )
+        stimulation_interval_average_without_rest_time = final_time_phase[
+            np.logical_and(final_time_phase <= threshold_stimulation_interval, final_time_phase != 0)
+        ]
         stimulation_interval_average = np.mean(stimulation_interval_average_without_rest_time)
         n_shooting = []
 
@@ -509,7 +511,7 @@ class DingModelFrequencyForceParameterIdentification:
             else:
                 n_shooting.append(stimulated_n_shooting)
 
-        return n_shooting, final_time_phase
+        return n_shooting, tuple(final_time_phase.tolist())
 
     def _force_model_identification_for_initial_guess(self):
         self.input_sanity(
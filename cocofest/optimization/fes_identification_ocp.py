@@ -218,11 +218,8 @@ class OcpFesId(OcpFes):
         # Sets the bound for all the phases
         x_bounds = BoundsList()
         variable_bound_list = model.name_dof
-        starting_bounds, min_bounds, max_bounds = (
-            model.standard_rest_values(),
-            model.standard_rest_values(),
-            model.standard_rest_values(),
-        )
+        rest_values = model.standard_rest_values()
+        starting_bounds, min_bounds, max_bounds = rest_values, rest_values.copy(), rest_values.copy()
 
         for i in range(len(variable_bound_list)):
             if variable_bound_list[i] == "Cn":
@@ -234,45 +231,40 @@ class OcpFesId(OcpFes):
             elif variable_bound_list[i] == "A":
                 min_bounds[i] = 0
 
-        starting_bounds_min = np.concatenate((starting_bounds, min_bounds, min_bounds), axis=1)
-        starting_bounds_max = np.concatenate((starting_bounds, max_bounds, max_bounds), axis=1)
-        middle_bound_min = np.concatenate((min_bounds, min_bounds, min_bounds), axis=1)
-        middle_bound_max = np.concatenate((max_bounds, max_bounds, max_bounds), axis=1)
+        starting_bounds_min = np.hstack((starting_bounds, np.tile(min_bounds, 2)))
+        starting_bounds_max = np.hstack((starting_bounds, np.tile(max_bounds, 2)))
+        middle_bound_min = np.tile(min_bounds, 3)
+        middle_bound_max = np.tile(max_bounds, 3)
 
         for i in range(n_stim):
+            # Phases starting from rest share the starting bounds, the others share the middle bounds
+            is_starting_phase = i == 0 or i in discontinuity_in_ocp
+            phase_bound_min = starting_bounds_min if is_starting_phase else middle_bound_min
+            phase_bound_max = starting_bounds_max if is_starting_phase else middle_bound_max
             for j in range(len(variable_bound_list)):
-                if i == 0 or i in discontinuity_in_ocp:
-                    x_bounds.add(
-                        variable_bound_list[j],
-                        min_bound=np.array([starting_bounds_min[j]]),
-                        max_bound=np.array([starting_bounds_max[j]]),
-                        phase=i,
-                        interpolation=InterpolationType.CONSTANT_WITH_FIRST_AND_LAST_DIFFERENT,
-                    )
-                else:
-                    x_bounds.add(
-                        variable_bound_list[j],
-                        min_bound=np.array([middle_bound_min[j]]),
-                        max_bound=np.array([middle_bound_max[j]]),
-                        phase=i,
-                        interpolation=InterpolationType.CONSTANT_WITH_FIRST_AND_LAST_DIFFERENT,
-                    )
+                x_bounds.add(
+                    variable_bound_list[j],
+                    min_bound=np.array([phase_bound_min[j]]),
+                    max_bound=np.array([phase_bound_max[j]]),
+                    phase=i,
+                    interpolation=InterpolationType.CONSTANT_WITH_FIRST_AND_LAST_DIFFERENT,
+                )
 
         x_init = InitialGuessList()
+        # First node index of each phase in the force_tracking list, the last value being the total node number
+        phase_first_node = np.concatenate(([0], np.cumsum(n_shooting)))
+        # The force is converted once, the trailing 0 being the last phase's final node initial guess
+        force_at_node = np.append(force_tracking, 0)
         for i in range(n_stim):
-            min_node = sum(n_shooting[:i])
-            max_node = sum(n_shooting[: i + 1])
-            force_in_phase = force_tracking[min_node : max_node + 1]
-            if i == n_stim - 1:
-                force_in_phase.append(0)
-            x_init.add("F", np.array([force_in_phase]), phase=i, interpolation=InterpolationType.EACH_FRAME)
+            force_in_phase = force_at_node[phase_first_node[i] : phase_first_node[i + 1] + 1]
+            x_init.add("F", force_in_phase[np.newaxis, :], phase=i, interpolation=InterpolationType.EACH_FRAME)
             x_init.add("Cn", [0], phase=i, interpolation=InterpolationType.CONSTANT)
             if model._with_fatigue:
                 for j in range(len(variable_bound_list)):
                     if variable_bound_list[j] == "F" or variable_bound_list[j] == "Cn":
                         pass
                     else:
-                        x_init.add(variable_bound_list[j], model.standard_rest_values()[j])
+                        x_init.add(variable_bound_list[j], rest_values[j])
 
         return x_bounds, x_init
 
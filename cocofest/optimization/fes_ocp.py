@@ -679,8 +679,8 @@ class OcpFes:
         # Creates the objective for our problem
         objective_functions = ObjectiveList()
         if custom_objective:
-            for i in range(len(custom_objective)):
-                objective_functions.add(custom_objective[0][i])
+            for objective in custom_objective[0]:
+                objective_functions.add(objective)
 
         if force_fourier_coef is not None:
             for phase in range(n_stim):
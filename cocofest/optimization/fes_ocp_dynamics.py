@@ -1,6 +1,7 @@
 import numpy as np
 
 from bioptim import (
+    BiorbdModel,
     BoundsList,
     ControlType,
     ConstraintList,
@@ -739,7 +740,7 @@ class OcpFesMsk:
 
     @staticmethod
     def _sanity_check_muscle_model(biorbd_model_path, fes_muscle_models):
-        tested_bio_model = FesMskModel(name=None, biorbd_path=biorbd_model_path, muscles_model=fes_muscle_models)
+        tested_bio_model = BiorbdModel(biorbd_model_path)
         fes_muscle_models_name_list = [fes_muscle_models[x].muscle_name for x in range(len(fes_muscle_models))]
         for biorbd_muscle in tested_bio_model.muscle_names:
             if biorbd_muscle not in fes_muscle_models_name_list:
@@ -767,12 +768,15 @@ class OcpFesMsk:
         if not isinstance(biorbd_model_path, str):
             raise TypeError("biorbd_model_path should be a string")
 
+        # The model is only loaded once the inputs that do not depend on it are validated,
+        # a BiorbdModel is enough to read nb_q and FesMskModel would parse the bioMod file twice
+        tested_bio_model = None
         if bound_type:
-            tested_bio_model = FesMskModel(name=None, biorbd_path=biorbd_model_path, muscles_model=fes_muscle_models)
             if not isinstance(bound_type, str) or bound_type not in ["start", "end", "start_end"]:
                 raise ValueError("bound_type should be a string and should be equal to start, end or start_end")
             if not isinstance(bound_data, list):
                 raise TypeError("bound_data should be a list")
+            tested_bio_model = BiorbdModel(biorbd_model_path)
             if bound_type == "start_end":
                 if len(bound_data) != 2 or not isinstance(bound_data[0], list) or not isinstance(bound_data[1], list):
                     raise TypeError("bound_data should be a list of two list")
@@ -841,9 +845,10 @@ class OcpFesMsk:
         if q_tracking:
             if not isinstance(q_tracking, list) and len(q_tracking) != 2:
                 raise TypeError("q_tracking should be a list of size 2")
-            tested_bio_model = FesMskModel(name=None, biorbd_path=biorbd_model_path, muscles_model=fes_muscle_models)
             if not isinstance(q_tracking[0], list | np.ndarray):
                 raise ValueError("q_tracking[0] should be a list or array type")
+            if tested_bio_model is None:
+                tested_bio_model = BiorbdModel(biorbd_model_path)
             if len(q_tracking[1]) != tested_bio_model.nb_q:
                 raise ValueError("q_tracking[1] should have the same size as the number of generalized coordinates")
             for i in range(tested_bio_model.nb_q):
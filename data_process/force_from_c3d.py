@@ -1,8 +1,6 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.signal import find_peaks
-from copy import deepcopy
-import heapq
+from scipy.signal import butter, find_peaks, sosfiltfilt
 import pickle
 
 from pyomeca import Analogs
@@ -36,11 +34,20 @@ class ExtractAnalogForceFromC3D:
                     "If you entered only one path, the file name will be iterated."
                 )
 
+        # The calibration matrix is the same for every c3d file
+        self.calibration_matrix = (
+            self.read_text_file_to_matrix(calibration_matrix_path) if calibration_matrix_path else None
+        )
+
         for i in range(len(c3d_path_list)):
             c3d_path = c3d_path_list[i]
             if not isinstance(c3d_path, str):
                 raise TypeError("c3d_path must be a str or a list of str.")
             raw_data = Analogs.from_c3d(c3d_path)
+            # Retrieving the arrays once to avoid the xarray overhead at each access
+            time = raw_data.time.values
+            stimulation_signal = raw_data[6].values
+            stimulation_channel = raw_data[7].values
 
             order = kwargs["order"] if "order" in kwargs else 1
             cutoff = kwargs["cutoff"] if "cutoff" in kwargs else 2
@@ -49,18 +56,17 @@ class ExtractAnalogForceFromC3D:
             if type(order) != type(cutoff):
                 raise TypeError("window_length and order must be both None or int type")
 
-            time = raw_data.time.values.tolist()
+            # Same zero phase Butterworth low pass as pyomeca's meca.low_pass, applied on the raw array
             filtered_data = (
-                np.array(raw_data.meca.low_pass(order=order, cutoff=cutoff, freq=raw_data.rate))
+                sosfiltfilt(butter(order, cutoff, btype="low", fs=raw_data.rate, output="sos"), raw_data.values)
                 if order and cutoff
-                else raw_data
+                else raw_data.values
             )
 
             if "input_channel" in kwargs:
                 filtered_data = self.reindex_2d_list(filtered_data, kwargs["input_channel"])
 
             if calibration_matrix_path:
-                self.calibration_matrix = self.read_text_file_to_matrix(calibration_matrix_path)
                 filtered_6d_force = self.calibration_matrix @ filtered_data[:6]
 
             else:
@@ -82,57 +88,39 @@ class ExtractAnalogForceFromC3D:
                 if "average_time_difference" in kwargs and "frequency_acquisition" in kwargs:
                     stimulation_time, peaks = self.stimulation_detection(
                         time,
-                        raw_data[6].data,
+                        stimulation_signal,
                         average_time_difference=kwargs["average_time_difference"],
                         frequency_acquisition=kwargs["frequency_acquisition"],
                         check_stimulation=check_stimulation,
                     )  # detect the stimulation time
                 else:
                     stimulation_time, peaks = self.stimulation_detection(
-                        time, raw_data[6].data, check_stimulation=check_stimulation
+                        time, stimulation_signal, check_stimulation=check_stimulation
                     )  # detect the stimulation time
                 sliced_time, sliced_data = self.slice_data(
                     time, filtered_6d_force, peaks
                 )  # slice the data into different stimulation
-                temp_time = deepcopy(sliced_time)
-                temp_data = deepcopy(sliced_data)
-                if down_sample:
+                plot = kwargs["plot"] if "plot" in kwargs else False
+                if plot and down_sample:
+                    # The down sampling replaces the slices without modifying them,
+                    # shallow copies are enough to plot the full slices afterward
+                    temp_time = list(sliced_time)
+                    temp_force = list(sliced_data[0])
+                if down_sample:  # keep one sample out of ten
                     for j in range(len(sliced_data[0])):
                         for k in range(len(sliced_data)):
-                            remove_list = []
-                            counter = 0
-                            for m in range(1, len(sliced_data[k][j])):
-                                if counter == 9:
-                                    counter = 0
-                                else:
-                                    remove_list.append(m)
-                                    counter += 1
-                            remove_list.reverse()
-                            for l in remove_list:
-                                sliced_data[k][j].pop(l)
-
-                        remove_list = []
-                        counter = 0
-                        for k in range(1, len(sliced_time[j])):
-                            if counter == 9:
-                                counter = 0
-                            else:
-                                remove_list.append(k)
-                                counter += 1
-                        remove_list.reverse()
-                        for l in remove_list:
-                            sliced_time[j].pop(l)
-
-                if "plot" in kwargs:
-                    if kwargs["plot"]:
+                            sliced_data[k][j] = sliced_data[k][j][::10]
+                        sliced_time[j] = sliced_time[j][::10]
+
+                if plot:
+                    for k in range(len(sliced_time)):
+                        plt.plot(sliced_time[k], sliced_data[0][k])
+                    for k in range(len(peaks)):
+                        plt.plot(time[peaks[k]], filtered_6d_force[0][peaks[k]], "x")
+                    if down_sample:
                         for k in range(len(sliced_time)):
-                            plt.plot(sliced_time[k], sliced_data[0][k])
-                        for k in range(len(peaks)):
-                            plt.plot(time[peaks[k]], filtered_6d_force[0][peaks[k]], "x")
-                        if down_sample:
-                            for k in range(len(sliced_time)):
-                                plt.plot(temp_time[k], temp_data[0][k])
-                        plt.show()
+                            plt.plot(temp_time[k], temp_force[k])
+                    plt.show()
 
                 if saving_pickle_path_list:
                     if len(saving_pickle_path_list) == 1:
@@ -143,51 +131,33 @@ class ExtractAnalogForceFromC3D:
                     else:
                         save_pickle_path = saving_pickle_path_list[i]
 
+                    # Force and torque are saved as float32, time stays float64 to keep the sampling precision
+                    saved_data = [[np.asarray(data, dtype=np.float32) for data in channel] for channel in sliced_data]
                     dictionary = {
                         "time": sliced_time,
-                        "x": sliced_data[0],
-                        "y": sliced_data[1],
-                        "z": sliced_data[2],
-                        "mx": sliced_data[3],
-                        "my": sliced_data[4],
-                        "mz": sliced_data[5],
+                        "x": saved_data[0],
+                        "y": saved_data[1],
+                        "z": saved_data[2],
+                        "mx": saved_data[3],
+                        "my": saved_data[4],
+                        "mz": saved_data[5],
                         "stim_time": stimulation_time,
                     }
                     with open(save_pickle_path, "wb") as file:
-                        pickle.dump(dictionary, file)
+                        pickle.dump(dictionary, file, protocol=pickle.HIGHEST_PROTOCOL)
             else:
                 if saving_pickle_path_list[:-4] == ".pkl":
                     save_pickle_path = saving_pickle_path_list[:-4] + "_" + str(i) + ".pkl"
                 else:
                     save_pickle_path = saving_pickle_path_list[0] + "_" + str(i) + ".pkl"
 
-                if down_sample:
-                    for j in range(len(filtered_6d_force[0])):
-                        for k in range(len(filtered_6d_force)):
-                            remove_list = []
-                            counter = 0
-                            for m in range(1, len(filtered_6d_force[k][j])):
-                                if counter == 9:
-                                    counter = 0
-                                else:
-                                    remove_list.append(m)
-                                    counter += 1
-                            remove_list.reverse()
-                            for l in remove_list:
-                                filtered_6d_force[k][j].pop(l)
-
-                        remove_list = []
-                        counter = 0
-                        for k in range(1, len(time[j])):
-                            if counter == 9:
-                                counter = 0
-                            else:
-                                remove_list.append(k)
-                                counter += 1
-                        remove_list.reverse()
-                        for l in remove_list:
-                            time[j].pop(l)
-                            raw_data[7].pop(l)
+                if down_sample:  # keep one sample out of ten
+                    filtered_6d_force = filtered_6d_force[:, ::10]
+                    time = time[::10]
+                    stimulation_channel = stimulation_channel[::10]
+
+                # Force and torque are saved as float32, time stays float64 to keep the sampling precision
+                filtered_6d_force = np.ascontiguousarray(filtered_6d_force, dtype=np.float32)
                 dictionary = {
                     "time": time,
                     "x": filtered_6d_force[0],
@@ -196,10 +166,10 @@ class ExtractAnalogForceFromC3D:
                     "mx": filtered_6d_force[3],
                     "my": filtered_6d_force[4],
                     "mz": filtered_6d_force[5],
-                    "stim_time": raw_data[7],
+                    "stim_time": stimulation_channel,
                 }
                 with open(save_pickle_path, "wb") as file:
-                    pickle.dump(dictionary, file)
+                    pickle.dump(dictionary, file, protocol=pickle.HIGHEST_PROTOCOL)
 
     @staticmethod
     def reindex_2d_list(data, new_indices):
@@ -214,18 +184,8 @@ class ExtractAnalogForceFromC3D:
 
     def read_text_file_to_matrix(self, file_path):
         try:
-            # Read the text file and split lines
-            with open(file_path, "r") as file:
-                lines = file.readlines()
-            # Initialize an empty list to store the rows
-            data = []
-            # Iterate through the lines, split by tabs, and convert to float
-            for line in lines:
-                row = [float(value) for value in line.strip().split("\t")]
-                data.append(row)
-            # Convert the list of lists to a NumPy matrix
-            matrix = np.array(data)
-            return matrix
+            # Read the tab separated text file directly into a NumPy matrix
+            return np.loadtxt(file_path, delimiter="\t", dtype=np.float64)
         except Exception as e:
             print(f"An error occurred: {str(e)}")
             return None
@@ -245,44 +205,63 @@ class ExtractAnalogForceFromC3D:
                 else data - np.mean(data[:average_length])
             )
         else:
-            for i in range(data.shape[0]):
-                data[i] = (
-                    data[i] - np.mean(data[i][average_on[0] : average_on[1]])
-                    if average_on
-                    else data[i] - np.mean(data[i][:average_length])
-                )
+            data -= (
+                data[:, average_on[0] : average_on[1]].mean(axis=1, keepdims=True)
+                if average_on
+                else data[:, :average_length].mean(axis=1, keepdims=True)
+            )
             return data
 
     def slice_data(self, time, data, stimulation_peaks, main_axis=0):
-        sliced_time = []
+        # There can not be more slices than stimulation peaks, the unused slots are trimmed at the end
+        n_peaks = len(stimulation_peaks)
+        sliced_time = [None] * n_peaks
+        sliced_data = [[None] * n_peaks for _ in range(6)]  # x, y, z, mx, my, mz
+        n_slices = 0
         temp_stimulation_peaks = stimulation_peaks
-        x = []
-        y = []
-        z = []
-        mx = []
-        my = []
-        mz = []
 
         while len(temp_stimulation_peaks) != 0:
-            substact_to_zero = data[:, temp_stimulation_peaks[0]]
-            for i in range(len(data[:, temp_stimulation_peaks[0]])):
-                data[:, temp_stimulation_peaks[0] :][i] = data[:, temp_stimulation_peaks[0] :][i] - substact_to_zero[i]
-
             first = temp_stimulation_peaks[0]
-            last = next(x for x, val in enumerate(-data[main_axis, first:]) if val < 0) + first
+            substact_to_zero = data[:, first].copy()
+            data[:, first:] -= substact_to_zero[:, np.newaxis]
 
-            x.append(data[0, first:last].tolist())
-            y.append(data[1, first:last].tolist())
-            z.append(data[2, first:last].tolist())
-            mx.append(data[3, first:last].tolist())
-            my.append(data[4, first:last].tolist())
-            mz.append(data[5, first:last].tolist())
+            positive_force = data[main_axis, first:] > 0
+            last = first + int(positive_force.argmax()) if positive_force.any() else data.shape[1]
 
-            sliced_time.append(time[first:last])
+            for channel in range(6):
+                sliced_data[channel][n_slices] = data[channel, first:last].copy()
+            sliced_time[n_slices] = time[first:last].copy()
+            n_slices += 1
 
             temp_stimulation_peaks = [peaks for peaks in temp_stimulation_peaks if peaks > last]
-        sliced_data = [x, y, z, mx, my, mz]
-        return sliced_time, sliced_data
+
+        sliced_data = [channel_data[:n_slices] for channel_data in sliced_data]
+        return sliced_time[:n_slices], sliced_data
+
+    @staticmethod
+    def stimulation_signal_preprocessing(stimulation_signal: np.array) -> tuple[np.array, float]:
+        """
+        Orient the stimulation signal so that its first peak is positive and compute the peak detection threshold
+        :param stimulation_signal: The stimulation signal
+        :return: The (possibly inverted) stimulation signal and the threshold to detect its peaks
+        """
+        # Thresholds are half of the mean of the 200 highest and lowest values of the signal (all of them if shorter)
+        k = min(200, stimulation_signal.size)
+        threshold_positive = np.mean(np.partition(stimulation_signal, -k)[-k:]) / 2
+        threshold_negative = np.mean(np.partition(stimulation_signal, k - 1)[:k]) / 2
+        positive_crossing = stimulation_signal > threshold_positive
+        negative_crossing = stimulation_signal < threshold_negative
+        has_positive_crossing = positive_crossing.any()
+        has_negative_crossing = negative_crossing.any()
+        if not has_positive_crossing and not has_negative_crossing:
+            raise ValueError("No sample of the stimulation signal crosses the peak detection thresholds.")
+
+        # argmax returns 0 on an all False mask, so the first crossing is only compared when it exists
+        if has_negative_crossing and (
+            not has_positive_crossing or negative_crossing.argmax() < positive_crossing.argmax()
+        ):  # invert the signal if the first peak is negative
+            return -stimulation_signal, -threshold_negative
+        return stimulation_signal, threshold_positive
 
     def stimulation_detection(
         self,
@@ -335,20 +314,9 @@ class ExtractAnalogForceFromC3D:
                     "average_time_difference must be bigger than the inverse of the acquisition frequency."
                 )
 
-        threshold_positive = np.mean(heapq.nlargest(200, stimulation_signal)) / 2
-        threshold_negative = np.mean(heapq.nsmallest(200, stimulation_signal)) / 2
-        positive = np.where(stimulation_signal > threshold_positive)
-        negative = np.where(stimulation_signal < threshold_negative)
-
-        if negative[0][0] < positive[0][0]:
-            stimulation_signal = -stimulation_signal  # invert the signal if the first peak is negative
-            threshold = -threshold_negative
-        else:
-            threshold = threshold_positive
+        stimulation_signal, threshold = self.stimulation_signal_preprocessing(stimulation_signal)
         peaks, _ = find_peaks(stimulation_signal, distance=10, height=threshold)
-        time_peaks = []
-        for i in range(len(peaks)):
-            time_peaks.append(time[peaks[i]])
+        time_peaks = np.asarray(time)[peaks]
 
         if check_stimulation:
             for k in range(len(time_peaks)):
@@ -357,15 +325,10 @@ class ExtractAnalogForceFromC3D:
             plt.show()
 
         if average_time_difference:
-            time_peaks = np.array(time_peaks) + average_time_difference
-            peaks = np.array(peaks) + int(average_time_difference * frequency_acquisition)
-
-        if isinstance(time_peaks, np.ndarray):
-            time_peaks = time_peaks.tolist()
-        if isinstance(peaks, np.ndarray):
-            peaks = peaks.tolist()
+            time_peaks = time_peaks + average_time_difference
+            peaks = peaks + int(average_time_difference * frequency_acquisition)
 
-        return time_peaks, peaks
+        return time_peaks.tolist(), peaks.tolist()
 
 
 if __name__ == "__main__":
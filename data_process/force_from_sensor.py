@@ -41,6 +41,8 @@ class ForceSensorToMuscleForce:  # TODO : Enable several muscles (biceps, tricep
         self.Qdot = None
         self.Qddot = None
         self.biceps_moment_arm = None
+        self.tau_without_external_force = None
+        self.external_force_to_tau = None
         self.biceps_force_vector = None
 
         pickle_path_list = [pickle_path] if isinstance(pickle_path, str) else pickle_path
@@ -65,7 +67,7 @@ class ForceSensorToMuscleForce:  # TODO : Enable several muscles (biceps, tricep
                 )
                 dictionary = {"time": self.time, muscle_name: self.all_biceps_force_vector, "stim_time": self.stim_time}
                 with open(save_pickle_path, "wb") as file:
-                    pickle.dump(dictionary, file)
+                    pickle.dump(dictionary, file, protocol=pickle.HIGHEST_PROTOCOL)
 
     def load_data(self, pickle_path, forearm_angle):
         # --- Retrieving pickle data --- #
@@ -74,7 +76,7 @@ class ForceSensorToMuscleForce:  # TODO : Enable several muscles (biceps, tricep
             sensor_data = []
             dict_name_list = ["mx", "my", "mz", "x", "y", "z"]
             for name in dict_name_list:
-                sensor_data.append(data[name])
+                sensor_data.append([np.asarray(stim_data, dtype=np.float64) for stim_data in data[name]])
 
         self.time = data["time"]
         self.stim_time = data["stim_time"]
@@ -100,10 +102,10 @@ class ForceSensorToMuscleForce:  # TODO : Enable several muscles (biceps, tricep
         """
         # TODO Might be an error when not at 90°
         hand_local_force_data = [
-            [[-x for x in data] for data in sensor_data[0]],
+            [-data for data in sensor_data[0]],
             sensor_data[2],
             sensor_data[1],
-            [[-x for x in data] for data in sensor_data[3]],
+            [-data for data in sensor_data[3]],
             sensor_data[5],
             sensor_data[4],
         ]
@@ -147,24 +149,15 @@ class ForceSensorToMuscleForce:  # TODO : Enable several muscles (biceps, tricep
 
         rotation_matrix = rotation_matrix_2 @ rotation_matrix_1
 
-        global_orientation_sensor_data = []
-        for i in range(len(sensor_data[0])):
-            sensor_data_temp_torque = (
-                rotation_matrix @ np.array([sensor_data[0][i], sensor_data[1][i], sensor_data[2][i]])
-            ).tolist()
-            sensor_data_temp_force = (
-                rotation_matrix @ np.array([sensor_data[3][i], sensor_data[4][i], sensor_data[5][i]])
-            ).tolist()
-            global_orientation_sensor_data.append(
-                [
-                    sensor_data_temp_torque[0],
-                    sensor_data_temp_torque[1],
-                    sensor_data_temp_torque[2],
-                    sensor_data_temp_force[0],
-                    sensor_data_temp_force[1],
-                    sensor_data_temp_force[2],
-                ]
-            )
+        # All the stimulations are concatenated to rotate the torques and forces of every sample at once
+        n_samples_per_stim = [len(stim_data) for stim_data in sensor_data[0]]
+        sensor_wrench = np.array([np.concatenate(channel) for channel in sensor_data]).reshape(2, 3, -1)
+        global_wrench = np.einsum("ij,kjl->kil", rotation_matrix, sensor_wrench).reshape(6, -1)
+
+        # Same [channel][stimulation] layout as local_sensor_to_local_hand
+        global_orientation_sensor_data = [
+            np.split(channel, np.cumsum(n_samples_per_stim)[:-1]) for channel in global_wrench
+        ]
 
         return global_orientation_sensor_data
 
@@ -184,10 +177,10 @@ class ForceSensorToMuscleForce:  # TODO : Enable several muscles (biceps, tricep
         self.Qddot = np.zeros((nqddot,))  # acceleration null
 
         # Biceps moment arm
-        self.model.musclesLengthJacobian(self.Q).to_array()
         if self.model.muscleNames()[1].to_string() != "BIClong":
             raise ValueError("Biceps muscle index as changed.")  # biceps is index 1 in the model
-        self.biceps_moment_arm = self.model.musclesLengthJacobian(self.Q).to_array()[1][1]
+        muscles_length_jacobian = self.model.musclesLengthJacobian(self.Q).to_array()
+        self.biceps_moment_arm = muscles_length_jacobian[1][1]
 
         # Expressing the external force array [Mx, My, Mz, Fx, Fy, Fz]
         # experimentally applied at the hand into the last joint
@@ -200,59 +193,42 @@ class ForceSensorToMuscleForce:  # TODO : Enable several muscles (biceps, tricep
         if self.model.markerNames()[4].to_string() != "hand":
             raise ValueError("hand marker index as changed.")
 
+        # With Q, Qdot and Qddot fixed, the inverse dynamics is affine in the external force applied at the hand.
+        # The elbow torque is computed once without external force and once per unit external force component,
+        # so that tau = tau_without_external_force + external_force_to_tau @ [Mx, My, Mz, Fx, Fy, Fz]
+        self.tau_without_external_force = self.model.InverseDynamics(self.Q, self.Qdot, self.Qddot).to_array()[1]
+        self.external_force_to_tau = np.zeros(6)
+        for i in range(6):
+            unit_external_forces_vector = np.zeros(6)
+            unit_external_forces_vector[i] = 1
+            external_forces_set = self.model.externalForceSet()
+            external_forces_set.addInSegmentReferenceFrame(
+                segmentName="r_ulna_radius_hand",
+                vector=unit_external_forces_vector,
+                pointOfApplication=np.array([0, 0, 0]),
+            )
+            tau = self.model.InverseDynamics(self.Q, self.Qdot, self.Qddot, external_forces_set).to_array()[1]
+            self.external_force_to_tau[i] = tau - self.tau_without_external_force
+
     def get_muscle_force(self, local_torque_force_vector):
         self.all_biceps_force_vector = []
-        for i in range(len(local_torque_force_vector)):
-            self.biceps_force_vector = []
-            for j in range(len(local_torque_force_vector[i][0])):
-                # a = self.model.markers(self.Q)[4].to_array()
-                # b = self.model.markers(Q)[3].to_array()  # [0, 0, 0]
-                # the 'b' point is not used for calculation as 'a' is expressed in 'b' local coordinates
-                # t_global = self.force_transport(
-                #     [
-                #         local_torque_force_vector[i][0][j],
-                #         local_torque_force_vector[i][1][j],
-                #         local_torque_force_vector[i][2][j],
-                #         local_torque_force_vector[i][3][j],
-                #         local_torque_force_vector[i][4][j],
-                #         local_torque_force_vector[i][5][j],
-                #     ],
-                #     a,
-                # )  # TODO make it a list : local_torque_force_vector
-
-                hand_local_vector = [
-                    local_torque_force_vector[i][0][j],
-                    local_torque_force_vector[i][1][j],
-                    local_torque_force_vector[i][2][j],
-                    local_torque_force_vector[i][3][j],
-                    local_torque_force_vector[i][4][j],
-                    local_torque_force_vector[i][5][j],
-                ]
-
-                #
-                # external_forces = np.array(t_global)[:, np.newaxis]
-                # external_forces_v = biorbd.to_spatial_vector(external_forces)
-
-                external_forces_vector = np.array(hand_local_vector)
-                external_forces_set = self.model.externalForceSet()
-                external_forces_set.addInSegmentReferenceFrame(
-                    segmentName="r_ulna_radius_hand",
-                    vector=external_forces_vector,
-                    pointOfApplication=np.array([0, 0, 0]),
-                )
-
-                # tau = self.model.InverseDynamics(self.Q, self.Qdot, self.Qddot, f_ext=external_forces_v).to_array()[1]
-                tau = self.model.InverseDynamics(self.Q, self.Qdot, self.Qddot, external_forces_set).to_array()
-                tau = tau[1]
-                biceps_force = tau / self.biceps_moment_arm
-                self.biceps_force_vector.append(biceps_force)
+        for i in range(len(local_torque_force_vector[0])):
+            # a = self.model.markers(self.Q)[4].to_array()
+            # b = self.model.markers(Q)[3].to_array()  # [0, 0, 0]
+            # the 'b' point is not used for calculation as 'a' is expressed in 'b' local coordinates
+            # t_global = self.force_transport(local_torque_force_vector[i], a)  # TODO make it a list
+
+            # [Mx, My, Mz, Fx, Fy, Fz] x n_samples of the i-th stimulation
+            hand_local_vector = np.array([local_torque_force_vector[k][i] for k in range(6)])
+            tau = self.tau_without_external_force + self.external_force_to_tau @ hand_local_vector
+            self.biceps_force_vector = tau / self.biceps_moment_arm
             hack = (
                 self.biceps_force_vector + self.biceps_force_vector[0]
                 if self.biceps_force_vector[0] > 0
                 else self.biceps_force_vector - self.biceps_force_vector[0]
             )
             self.all_biceps_force_vector.append(
-                self.biceps_force_vector
+                self.biceps_force_vector.tolist()
                 # hack.tolist()
             )  # TODO: This is an hack, find why muscle force is sometimes negative when it shouldn't
 
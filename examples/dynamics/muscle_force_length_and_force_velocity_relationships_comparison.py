@@ -46,13 +46,14 @@ for i in range(2):
 
     sol_time.append(time)
 
-plt.plot(sol_time[0], np.degrees(sol_list[0]["q"][0]), label="without relationships")
-plt.plot(sol_time[1], np.degrees(sol_list[1]["q"][0]), label="with relationships")
+# Both problems share the same time grid, the joint angles are stacked to be plotted in a single call
+q_degrees = np.degrees(np.vstack([sol["q"][0] for sol in sol_list]))
+plt.plot(sol_time[0], q_degrees.T)
 
 plt.xlabel("Time (s)")
 plt.ylabel("Angle (°)")
-plt.legend()
+plt.legend(["without relationships", "with relationships"])
 plt.show()
 
-joint_overestimation = np.degrees(sol_list[0]["q"][0][-1]) - np.degrees(sol_list[1]["q"][0][-1])
+joint_overestimation = q_degrees[0, -1] - q_degrees[1, -1]
 print(f"Joint overestimation: {joint_overestimation} degrees")
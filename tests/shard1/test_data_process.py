@@ -0,0 +1,102 @@
+import os
+
+import numpy as np
+import pytest
+
+from data_process.force_from_c3d import ExtractAnalogForceFromC3D
+from data_process import force_from_sensor
+from data_process.force_from_sensor import ForceSensorToMuscleForce
+
+
+@pytest.mark.parametrize("first_peak_sign", [1, -1])
+def test_stimulation_signal_preprocessing_short_signal(first_peak_sign):
+    # Fewer samples than the 200 highest and lowest values used for the thresholds, so all of them are averaged
+    stimulation_signal = np.zeros(50)
+    stimulation_signal[[10, 30]] = first_peak_sign * 4
+    stimulation_signal[[12, 32]] = -first_peak_sign * 4
+
+    signal, threshold = ExtractAnalogForceFromC3D.stimulation_signal_preprocessing(stimulation_signal)
+
+    np.testing.assert_almost_equal(threshold, 0)
+    np.testing.assert_almost_equal(signal, first_peak_sign * stimulation_signal)
+    assert signal[10] == 4
+    assert stimulation_signal[10] == first_peak_sign * 4
+
+
+@pytest.mark.parametrize("forearm_angle", [90, 120])
+def test_external_force_to_tau_matches_inverse_dynamics(forearm_angle, monkeypatch):
+    # load_model opens the arm model relative to the data_process folder
+    monkeypatch.chdir(os.path.dirname(force_from_sensor.__file__))
+    force_sensor_to_muscle_force = ForceSensorToMuscleForce.__new__(ForceSensorToMuscleForce)
+    force_sensor_to_muscle_force.load_model(forearm_angle)
+    model = force_sensor_to_muscle_force.model
+
+    np.random.seed(42)
+    for external_forces_vector in np.random.uniform(-10, 10, (5, 6)):
+        external_forces_set = model.externalForceSet()
+        external_forces_set.addInSegmentReferenceFrame(
+            segmentName="r_ulna_radius_hand",
+            vector=external_forces_vector,
+            pointOfApplication=np.array([0, 0, 0]),
+        )
+        tau = model.InverseDynamics(
+            force_sensor_to_muscle_force.Q,
+            force_sensor_to_muscle_force.Qdot,
+            force_sensor_to_muscle_force.Qddot,
+            external_forces_set,
+        ).to_array()[1]
+
+        np.testing.assert_almost_equal(
+            force_sensor_to_muscle_force.tau_without_external_force
+            + force_sensor_to_muscle_force.external_force_to_tau @ external_forces_vector,
+            tau,
+        )
+
+
+def test_get_muscle_force_channel_major_layout():
+    force_sensor_to_muscle_force = ForceSensorToMuscleForce.__new__(ForceSensorToMuscleForce)
+    force_sensor_to_muscle_force.plot = False
+    force_sensor_to_muscle_force.tau_without_external_force = 0.5
+    force_sensor_to_muscle_force.external_force_to_tau = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    force_sensor_to_muscle_force.biceps_moment_arm = 0.04
+
+    # [Mx, My, Mz, Fx, Fy, Fz] channels of two stimulations with a different number of samples
+    np.random.seed(42)
+    n_samples_per_stim = [3, 5]
+    local_torque_force_vector = [[np.random.rand(n_samples) for n_samples in n_samples_per_stim] for _ in range(6)]
+
+    force_sensor_to_muscle_force.get_muscle_force(local_torque_force_vector)
+
+    assert len(force_sensor_to_muscle_force.all_biceps_force_vector) == len(n_samples_per_stim)
+    for i, n_samples in enumerate(n_samples_per_stim):
+        expected_biceps_force = [
+            (
+                force_sensor_to_muscle_force.tau_without_external_force
+                + sum(
+                    force_sensor_to_muscle_force.external_force_to_tau[k] * local_torque_force_vector[k][i][j]
+                    for k in range(6)
+                )
+            )
+            / force_sensor_to_muscle_force.biceps_moment_arm
+            for j in range(n_samples)
+        ]
+        np.testing.assert_almost_equal(force_sensor_to_muscle_force.all_biceps_force_vector[i], expected_biceps_force)
+
+
+def test_local_to_global_channel_major_layout():
+    # [Mx, My, Mz, Fx, Fy, Fz] channels of two stimulations with a different number of samples
+    np.random.seed(42)
+    n_samples_per_stim = [3, 5]
+    sensor_data = [[np.random.rand(n_samples) for n_samples in n_samples_per_stim] for _ in range(6)]
+
+    global_orientation_sensor_data = ForceSensorToMuscleForce.local_to_global(sensor_data, forearm_angle=90)
+
+    assert len(global_orientation_sensor_data) == 6
+    for k in range(6):
+        assert [len(stim_data) for stim_data in global_orientation_sensor_data[k]] == n_samples_per_stim
+    # At 90°, x_global = -z_local, y_global = -x_local and z_global = y_local for both torques and forces
+    for i in range(len(n_samples_per_stim)):
+        for offset in [0, 3]:
+            np.testing.assert_almost_equal(global_orientation_sensor_data[offset][i], -sensor_data[offset + 2][i])
+            np.testing.assert_almost_equal(global_orientation_sensor_data[offset + 1][i], -sensor_data[offset][i])
+            np.testing.assert_almost_equal(global_orientation_sensor_data[offset + 2][i], sensor_data[offset + 1][i])
@@ -1,10 +1,11 @@
 import numpy as np
-from casadi import DM
+from casadi import DM, Function, SX
 
 from cocofest import (
     DingModelFrequencyWithFatigue,
     DingModelPulseDurationFrequencyWithFatigue,
     DingModelIntensityFrequencyWithFatigue,
+    FourierSeries,
 )
 
 
@@ -200,3 +201,34 @@ def test_hmed2018_dynamics():
     np.testing.assert_almost_equal(
         np.array(model.lambda_i_calculation(intensity_stim=30)).squeeze(), np.array(DM(0.0799499)).squeeze()
     )
+
+
+def test_fourier_series_numpy_and_casadi_modes():
+    fourier = FourierSeries()
+    time = np.linspace(0, 1, 101)
+    force = 100 * np.sin(np.pi * time) ** 2 + 10 * time
+    coefficients = fourier.compute_real_fourier_coeffs(time, force, 10)
+    assert coefficients.shape == (11, 2)
+
+    evaluation_time = np.array([0, 0.123, 0.5, 0.75, 1])
+    harmonics = np.arange(1, 11)
+    expected_value = np.array(
+        [
+            coefficients[0, 0] / 2
+            + np.sum(
+                coefficients[1:, 0] * np.cos(2 * np.pi * harmonics * t)
+                + coefficients[1:, 1] * np.sin(2 * np.pi * harmonics * t)
+            )
+            for t in evaluation_time
+        ]
+    )
+
+    numpy_value = fourier.fit_func_by_fourier_series_with_real_coeffs(evaluation_time, coefficients, mode="numpy")
+    np.testing.assert_almost_equal(numpy_value, expected_value)
+
+    x = SX.sym("x")
+    casadi_function = Function(
+        "fourier", [x], [fourier.fit_func_by_fourier_series_with_real_coeffs(x, coefficients, mode="casadi")]
+    )
+    casadi_value = np.array([float(casadi_function(t)) for t in evaluation_time])
+    np.testing.assert_almost_equal(casadi_value, numpy_value)
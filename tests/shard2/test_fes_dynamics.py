@@ -21,6 +21,15 @@ from examples.msk_models import init as ocp_module
 biomodel_folder = os.path.dirname(ocp_module.__file__)
 biorbd_model_path = biomodel_folder + "/arm26_biceps_triceps.bioMod"
 
+minimum_pulse_duration = DingModelPulseDurationFrequencyWithFatigue().pd0
+minimum_pulse_intensity = DingModelIntensityFrequencyWithFatigue().min_pulse_intensity()
+
+# Muscle models shared by the sanity check cases, those cases raise before the models are used to build an ocp
+sanity_check_fes_muscle_models = [
+    DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
+    DingModelPulseDurationFrequencyWithFatigue(muscle_name="TRIlong"),
+]
+
 
 def test_pulse_duration_multi_muscle_fes_dynamics():
     objective_functions = ObjectiveList()
@@ -28,7 +37,6 @@ def test_pulse_duration_multi_muscle_fes_dynamics():
     for i in range(n_stim):
         objective_functions.add(ObjectiveFcn.Lagrange.MINIMIZE_CONTROL, key="tau", weight=1, quadratic=True, phase=i)
 
-    minimum_pulse_duration = DingModelPulseDurationFrequencyWithFatigue().pd0
     ocp = OcpFesMsk.prepare_ocp(
         biorbd_model_path=biorbd_model_path,
         bound_type="start_end",
@@ -99,9 +107,6 @@ def test_pulse_duration_multi_muscle_fes_dynamics():
 
 def test_pulse_intensity_multi_muscle_fes_dynamics():
     n_stim = 10
-    minimum_pulse_intensity = DingModelIntensityFrequencyWithFatigue.min_pulse_intensity(
-        DingModelIntensityFrequencyWithFatigue()
-    )
     track_forces = [
         np.array([0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1]),
         [np.array([0, 10, 40, 90, 140, 80, 50, 10, 0, 0, 0]), np.array([0, 0, 0, 10, 40, 90, 140, 80, 50, 10, 0])],
@@ -175,485 +180,120 @@ def test_pulse_intensity_multi_muscle_fes_dynamics():
     np.testing.assert_almost_equal(sol_states["F_TRIlong"][0][-1], 29.131785, decimal=4)
 
 
-def test_fes_models_inputs_sanity_check_errors():
-    with pytest.raises(
-        TypeError,
-        match=re.escape("biorbd_model_path should be a string"),
-    ):
-        ocp = OcpFesMsk.prepare_ocp(
-            biorbd_model_path=5,
-            bound_type="start_end",
-            bound_data=[[0, 5], [0, 120]],
-            fes_muscle_models=[
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="TRIlong"),
-            ],
-            n_stim=1,
-            n_shooting=10,
-            final_time=1,
-            pulse_duration_min=0.0003,
-            pulse_duration_max=0.0006,
-        )
-
-    with pytest.raises(
-        ValueError,
-        match=re.escape("bound_type should be a string and should be equal to start, end or start_end"),
-    ):
-        ocp = OcpFesMsk.prepare_ocp(
-            biorbd_model_path=biorbd_model_path,
-            bound_type="hello",
-            bound_data=[[0, 5], [0, 120]],
-            fes_muscle_models=[
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="TRIlong"),
-            ],
-            n_stim=1,
-            n_shooting=10,
-            final_time=1,
-            pulse_duration_min=0.0003,
-            pulse_duration_max=0.0006,
-        )
-
-    with pytest.raises(
-        TypeError,
-        match=re.escape("bound_data should be a list"),
-    ):
-        ocp = OcpFesMsk.prepare_ocp(
-            biorbd_model_path=biorbd_model_path,
-            bound_type="start_end",
-            bound_data="[[0, 5], [0, 120]]",
-            fes_muscle_models=[
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="TRIlong"),
-            ],
-            n_stim=1,
-            n_shooting=10,
-            final_time=1,
-            pulse_duration_min=0.0003,
-            pulse_duration_max=0.0006,
-        )
-
-    with pytest.raises(
-        ValueError,
-        match=re.escape(f"bound_data should be a list of {2} elements"),
-    ):
-        ocp = OcpFesMsk.prepare_ocp(
-            biorbd_model_path=biorbd_model_path,
-            bound_type="start_end",
-            bound_data=[[0, 5, 7], [0, 120, 150]],
-            fes_muscle_models=[
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="TRIlong"),
-            ],
-            n_stim=1,
-            n_shooting=10,
-            final_time=1,
-            pulse_duration_min=0.0003,
-            pulse_duration_max=0.0006,
-        )
-
-    with pytest.raises(
-        TypeError,
-        match=re.escape(f"bound_data should be a list of two list"),
-    ):
-        ocp = OcpFesMsk.prepare_ocp(
-            biorbd_model_path=biorbd_model_path,
-            bound_type="start_end",
-            bound_data=["[0, 5]", [0, 120]],
-            fes_muscle_models=[
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="TRIlong"),
-            ],
-            n_stim=1,
-            n_shooting=10,
-            final_time=1,
-            pulse_duration_min=0.0003,
-            pulse_duration_max=0.0006,
-        )
-
-    with pytest.raises(
-        ValueError,
-        match=re.escape(f"bound_data should be a list of {2} elements"),
-    ):
-        ocp = OcpFesMsk.prepare_ocp(
-            biorbd_model_path=biorbd_model_path,
-            bound_type="start_end",
-            bound_data=[[0, 5, 7], [0, 120, 150]],
-            fes_muscle_models=[
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="TRIlong"),
-            ],
-            n_stim=1,
-            n_shooting=10,
-            final_time=1,
-            pulse_duration_min=0.0003,
-            pulse_duration_max=0.0006,
-        )
-
-    with pytest.raises(
-        TypeError,
-        match=re.escape(f"bound data index {1}: {5} and {'120'} should be an int or float"),
-    ):
-        ocp = OcpFesMsk.prepare_ocp(
-            biorbd_model_path=biorbd_model_path,
-            bound_type="start_end",
-            bound_data=[[0, 5], [0, "120"]],
-            fes_muscle_models=[
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="TRIlong"),
-            ],
-            n_stim=1,
-            n_shooting=10,
-            final_time=1,
-            pulse_duration_min=0.0003,
-            pulse_duration_max=0.0006,
-        )
-
-    with pytest.raises(
-        ValueError,
-        match=re.escape(f"bound_data should be a list of {2} element"),
-    ):
-        ocp = OcpFesMsk.prepare_ocp(
-            biorbd_model_path=biorbd_model_path,
-            bound_type="start",
-            bound_data=[0, 5, 10],
-            fes_muscle_models=[
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="TRIlong"),
-            ],
-            n_stim=1,
-            n_shooting=10,
-            final_time=1,
-            pulse_duration_min=0.0003,
-            pulse_duration_max=0.0006,
-        )
-
-    with pytest.raises(
-        TypeError,
-        match=re.escape(f"bound data index {1}: {'5'} should be an int or float"),
-    ):
-        ocp = OcpFesMsk.prepare_ocp(
-            biorbd_model_path=biorbd_model_path,
-            bound_type="end",
-            bound_data=[0, "5"],
-            fes_muscle_models=[
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="TRIlong"),
-            ],
-            n_stim=1,
-            n_shooting=10,
-            final_time=1,
-            pulse_duration_min=0.0003,
-            pulse_duration_max=0.0006,
-        )
-
-    with pytest.raises(
-        TypeError,
-        match=re.escape(
+@pytest.mark.parametrize(
+    "ocp_settings, error, message",
+    [
+        (
+            {"biorbd_model_path": 5, "bound_type": "start_end", "bound_data": [[0, 5], [0, 120]]},
+            TypeError,
+            "biorbd_model_path should be a string",
+        ),
+        (
+            {"bound_type": "hello", "bound_data": [[0, 5], [0, 120]]},
+            ValueError,
+            "bound_type should be a string and should be equal to start, end or start_end",
+        ),
+        (
+            {"bound_type": "start_end", "bound_data": "[[0, 5], [0, 120]]"},
+            TypeError,
+            "bound_data should be a list",
+        ),
+        (
+            {"bound_type": "start_end", "bound_data": [[0, 5, 7], [0, 120, 150]]},
+            ValueError,
+            "bound_data should be a list of 2 elements",
+        ),
+        (
+            {"bound_type": "start_end", "bound_data": ["[0, 5]", [0, 120]]},
+            TypeError,
+            "bound_data should be a list of two list",
+        ),
+        (
+            {"bound_type": "start_end", "bound_data": [[0, 5], [0, "120"]]},
+            TypeError,
+            "bound data index 1: 5 and 120 should be an int or float",
+        ),
+        ({"bound_data": [0, 5, 10]}, ValueError, "bound_data should be a list of 2 element"),
+        ({"bound_type": "end", "bound_data": [0, "5"]}, TypeError, "bound data index 1: 5 should be an int or float"),
+        (
+            {
+                "fes_muscle_models": [
+                    sanity_check_fes_muscle_models[0],
+                    "DingModelPulseDurationFrequencyWithFatigue(muscle_name='TRIlong')",
+                ]
+            },
+            TypeError,
             "model must be a DingModelFrequency,"
             " DingModelFrequencyWithFatigue,"
             " DingModelPulseDurationFrequency,"
             " DingModelPulseDurationFrequencyWithFatigue,"
             " DingModelIntensityFrequency,"
-            " DingModelIntensityFrequencyWithFatigue type"
+            " DingModelIntensityFrequencyWithFatigue type",
         ),
-    ):
-        ocp = OcpFesMsk.prepare_ocp(
-            biorbd_model_path=biorbd_model_path,
-            bound_type="start",
-            bound_data=[0, 5],
-            fes_muscle_models=[
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
-                "DingModelPulseDurationFrequencyWithFatigue(muscle_name='TRIlong')",
-            ],
-            n_stim=1,
-            n_shooting=10,
-            final_time=1,
-            pulse_duration_min=0.0003,
-            pulse_duration_max=0.0006,
-        )
-
-    with pytest.raises(
-        TypeError,
-        match=re.escape(f"force_tracking: {'hello'} must be list type"),
-    ):
-        ocp = OcpFesMsk.prepare_ocp(
-            biorbd_model_path=biorbd_model_path,
-            bound_type="start",
-            bound_data=[0, 5],
-            fes_muscle_models=[
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="TRIlong"),
-            ],
-            n_stim=1,
-            n_shooting=10,
-            final_time=1,
-            pulse_duration_min=0.0003,
-            pulse_duration_max=0.0006,
-            force_tracking="hello",
-        )
-
-    with pytest.raises(
-        ValueError,
-        match=re.escape("force_tracking must of size 2"),
-    ):
-        ocp = OcpFesMsk.prepare_ocp(
-            biorbd_model_path=biorbd_model_path,
-            bound_type="end",
-            bound_data=[0, 5],
-            fes_muscle_models=[
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="TRIlong"),
-            ],
-            n_stim=1,
-            n_shooting=10,
-            final_time=1,
-            pulse_duration_min=0.0003,
-            pulse_duration_max=0.0006,
-            force_tracking=["hello"],
-        )
-
-    with pytest.raises(
-        TypeError,
-        match=re.escape(f"force_tracking index 0: {'hello'} must be np.ndarray type"),
-    ):
-        ocp = OcpFesMsk.prepare_ocp(
-            biorbd_model_path=biorbd_model_path,
-            bound_type="start",
-            bound_data=[0, 5],
-            fes_muscle_models=[
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="TRIlong"),
-            ],
-            n_stim=1,
-            n_shooting=10,
-            final_time=1,
-            pulse_duration_min=0.0003,
-            pulse_duration_max=0.0006,
-            force_tracking=["hello", [1, 2, 3]],
-        )
-
-    with pytest.raises(
-        TypeError,
-        match=re.escape(f"force_tracking index 1: {'[1, 2, 3]'} must be list type"),
-    ):
-        ocp = OcpFesMsk.prepare_ocp(
-            biorbd_model_path=biorbd_model_path,
-            bound_type="start",
-            bound_data=[0, 5],
-            fes_muscle_models=[
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="TRIlong"),
-            ],
-            n_stim=1,
-            n_shooting=10,
-            final_time=1,
-            pulse_duration_min=0.0003,
-            pulse_duration_max=0.0006,
-            force_tracking=[np.array([1, 2, 3]), "[1, 2, 3]"],
-        )
-
-    with pytest.raises(
-        ValueError,
-        match=re.escape(
-            "force_tracking index 1 list must have the same size as the number of muscles in fes_muscle_models"
+        ({"force_tracking": "hello"}, TypeError, "force_tracking: hello must be list type"),
+        ({"bound_type": "end", "force_tracking": ["hello"]}, ValueError, "force_tracking must of size 2"),
+        (
+            {"force_tracking": ["hello", [1, 2, 3]]},
+            TypeError,
+            "force_tracking index 0: hello must be np.ndarray type",
         ),
-    ):
-        ocp = OcpFesMsk.prepare_ocp(
-            biorbd_model_path=biorbd_model_path,
-            bound_type="start",
-            bound_data=[0, 5],
-            fes_muscle_models=[
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="TRIlong"),
-            ],
-            n_stim=1,
-            n_shooting=10,
-            final_time=1,
-            pulse_duration_min=0.0003,
-            pulse_duration_max=0.0006,
-            force_tracking=[np.array([1, 2, 3]), [[1, 2, 3], [1, 2, 3], [1, 2, 3]]],
-        )
-
-    with pytest.raises(
-        ValueError,
-        match=re.escape("force_tracking time and force argument must be the same length"),
-    ):
-        ocp = OcpFesMsk.prepare_ocp(
-            biorbd_model_path=biorbd_model_path,
-            bound_type="start",
-            bound_data=[0, 5],
-            fes_muscle_models=[
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="TRIlong"),
-            ],
-            n_stim=1,
-            n_shooting=10,
-            final_time=1,
-            pulse_duration_min=0.0003,
-            pulse_duration_max=0.0006,
-            force_tracking=[np.array([1, 2, 3]), [[1, 2, 3], [1, 2]]],
-        )
-
-    with pytest.raises(
-        TypeError,
-        match=re.escape(f"force_tracking: {'hello'} must be list type"),
-    ):
-        ocp = OcpFesMsk.prepare_ocp(
-            biorbd_model_path=biorbd_model_path,
-            bound_type="start",
-            bound_data=[0, 5],
-            fes_muscle_models=[
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="TRIlong"),
-            ],
-            n_stim=1,
-            n_shooting=10,
-            final_time=1,
-            pulse_duration_min=0.0003,
-            pulse_duration_max=0.0006,
-            end_node_tracking="hello",
-        )
-
-    with pytest.raises(
-        ValueError,
-        match=re.escape("end_node_tracking list must have the same size as the number of muscles in fes_muscle_models"),
-    ):
-        ocp = OcpFesMsk.prepare_ocp(
-            biorbd_model_path=biorbd_model_path,
-            bound_type="start",
-            bound_data=[0, 5],
-            fes_muscle_models=[
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="TRIlong"),
-            ],
-            n_stim=1,
-            n_shooting=10,
-            final_time=1,
-            pulse_duration_min=0.0003,
-            pulse_duration_max=0.0006,
-            end_node_tracking=[2, 3, 4],
-        )
-
-    with pytest.raises(
-        TypeError,
-        match=re.escape(f"end_node_tracking index {1}: {'hello'} must be int or float type"),
-    ):
-        ocp = OcpFesMsk.prepare_ocp(
-            biorbd_model_path=biorbd_model_path,
-            bound_type="start",
-            bound_data=[0, 5],
-            fes_muscle_models=[
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="TRIlong"),
-            ],
-            n_stim=1,
-            n_shooting=10,
-            final_time=1,
-            pulse_duration_min=0.0003,
-            pulse_duration_max=0.0006,
-            end_node_tracking=[2, "hello"],
-        )
-
-    with pytest.raises(
-        TypeError,
-        match=re.escape("q_tracking should be a list of size 2"),
-    ):
-        ocp = OcpFesMsk.prepare_ocp(
-            biorbd_model_path=biorbd_model_path,
-            bound_type="start",
-            bound_data=[0, 5],
-            fes_muscle_models=[
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="TRIlong"),
-            ],
-            n_stim=1,
-            n_shooting=10,
-            final_time=1,
-            pulse_duration_min=0.0003,
-            pulse_duration_max=0.0006,
-            q_tracking="hello",
-        )
-
-    with pytest.raises(
-        ValueError,
-        match=re.escape("q_tracking[0] should be a list"),
-    ):
-        ocp = OcpFesMsk.prepare_ocp(
-            biorbd_model_path=biorbd_model_path,
-            bound_type="start",
-            bound_data=[0, 5],
-            fes_muscle_models=[
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="TRIlong"),
-            ],
-            n_stim=1,
-            n_shooting=10,
-            final_time=1,
-            pulse_duration_min=0.0003,
-            pulse_duration_max=0.0006,
-            q_tracking=["hello", [1, 2, 3]],
-        )
-
-    with pytest.raises(
-        ValueError,
-        match=re.escape("q_tracking[1] should have the same size as the number of generalized coordinates"),
-    ):
-        ocp = OcpFesMsk.prepare_ocp(
-            biorbd_model_path=biorbd_model_path,
-            bound_type="start",
-            bound_data=[0, 5],
-            fes_muscle_models=[
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="TRIlong"),
-            ],
-            n_stim=1,
-            n_shooting=10,
-            final_time=1,
-            pulse_duration_min=0.0003,
-            pulse_duration_max=0.0006,
-            q_tracking=[[1, 2, 3], [1, 2, 3]],
-        )
-
-    with pytest.raises(
-        ValueError,
-        match=re.escape("q_tracking[0] and q_tracking[1] should have the same size"),
-    ):
-        ocp = OcpFesMsk.prepare_ocp(
-            biorbd_model_path=biorbd_model_path,
-            bound_type="start",
-            bound_data=[0, 5],
-            fes_muscle_models=[
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="TRIlong"),
-            ],
-            n_stim=1,
-            n_shooting=10,
-            final_time=1,
-            pulse_duration_min=0.0003,
-            pulse_duration_max=0.0006,
-            q_tracking=[[1, 2, 3], [[1, 2, 3], [4, 5]]],
-        )
-
-    with pytest.raises(
-        TypeError,
-        match=re.escape(f"{'with_residual_torque'} should be a boolean"),
-    ):
-        ocp = OcpFesMsk.prepare_ocp(
-            biorbd_model_path=biorbd_model_path,
-            bound_type="start",
-            bound_data=[0, 5],
-            fes_muscle_models=[
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong"),
-                DingModelPulseDurationFrequencyWithFatigue(muscle_name="TRIlong"),
-            ],
-            n_stim=1,
-            n_shooting=10,
-            final_time=1,
-            pulse_duration_min=0.0003,
-            pulse_duration_max=0.0006,
-            with_residual_torque="hello",
-        )
+        (
+            {"force_tracking": [np.array([1, 2, 3]), "[1, 2, 3]"]},
+            TypeError,
+            "force_tracking index 1: [1, 2, 3] must be list type",
+        ),
+        (
+            {"force_tracking": [np.array([1, 2, 3]), [[1, 2, 3], [1, 2, 3], [1, 2, 3]]]},
+            ValueError,
+            "force_tracking index 1 list must have the same size as the number of muscles in fes_muscle_models",
+        ),
+        (
+            {"force_tracking": [np.array([1, 2, 3]), [[1, 2, 3], [1, 2]]]},
+            ValueError,
+            "force_tracking time and force argument must be the same length",
+        ),
+        ({"end_node_tracking": "hello"}, TypeError, "force_tracking: hello must be list type"),
+        (
+            {"end_node_tracking": [2, 3, 4]},
+            ValueError,
+            "end_node_tracking list must have the same size as the number of muscles in fes_muscle_models",
+        ),
+        (
+            {"end_node_tracking": [2, "hello"]},
+            TypeError,
+            "end_node_tracking index 1: hello must be int or float type",
+        ),
+        ({"q_tracking": "hello"}, TypeError, "q_tracking should be a list of size 2"),
+        ({"q_tracking": ["hello", [1, 2, 3]]}, ValueError, "q_tracking[0] should be a list"),
+        (
+            {"q_tracking": [[1, 2, 3], [1, 2, 3]]},
+            ValueError,
+            "q_tracking[1] should have the same size as the number of generalized coordinates",
+        ),
+        (
+            {"q_tracking": [[1, 2, 3], [[1, 2, 3], [4, 5]]]},
+            ValueError,
+            "q_tracking[0] and q_tracking[1] should have the same size",
+        ),
+        ({"with_residual_torque": "hello"}, TypeError, "with_residual_torque should be a boolean"),
+    ],
+)
+def test_fes_models_inputs_sanity_check_errors(ocp_settings, error, message):
+    ocp_kwargs = {
+        "biorbd_model_path": biorbd_model_path,
+        "bound_type": "start",
+        "bound_data": [0, 5],
+        "fes_muscle_models": sanity_check_fes_muscle_models,
+        "n_stim": 1,
+        "n_shooting": 10,
+        "final_time": 1,
+        "pulse_duration_min": 0.0003,
+        "pulse_duration_max": 0.0006,
+    }
+    ocp_kwargs.update(ocp_settings)
+
+    with pytest.raises(error, match=re.escape(message)):
+        OcpFesMsk.prepare_ocp(**ocp_kwargs)
 
 
 def test_fes_muscle_models_sanity_check_errors():
@@ -669,7 +309,7 @@ def test_fes_muscle_models_sanity_check_errors():
             biorbd_model_path=biorbd_model_path,
             bound_type="start",
             bound_data=[0, 5],
-            fes_muscle_models=[DingModelPulseDurationFrequencyWithFatigue(muscle_name="BIClong")],
+            fes_muscle_models=sanity_check_fes_muscle_models[:1],
             n_stim=1,
             n_shooting=10,
             final_time=1,